@@ -1,20 +1,22 @@
 import logging
-mylog = logging.getLogger().getChild('mdl_b')
-
-mylog.info('Loading '  + mylog.name + '.')
+mylog = logging.getLogger('app.' + __name__) # Child of application logger (utils.logz.LOGGER_NAME); no utils import needed.
 
 var_a = "Hi! I'm " + mylog.name + '.var_a!'
 var_b = "Hi! I'm " + mylog.name + '.var_b!'
 var_z = "Hi! I'm " + mylog.name + '.var_z!'
 
+_FNCTN_A_MSG = "%s I'm in " + mylog.name + '.fnctn_a!'
+_FNCTN_B_MSG = "%s I'm in " + mylog.name + '.fnctn_b!'
+_FNCTN_Z_MSG = "%s I'm in " + mylog.name + '.fnctn_z!'
+
 def fnctn_a(var_n):
-    mylog.info(var_n + " I'm in " + mylog.name + '.fnctn_a!')
+    mylog.info(_FNCTN_A_MSG, var_n)
 
 def fnctn_b(var_n):
-    mylog.info(var_n + " I'm in " + mylog.name + '.fnctn_b!')
+    mylog.info(_FNCTN_B_MSG, var_n)
 
 def fnctn_z(var_n):
-    mylog.info(var_n + " I'm in " + mylog.name + '.fnctn_z!')
+    mylog.info(_FNCTN_Z_MSG, var_n)
 
 
 if __name__ == '__main__':
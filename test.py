@@ -1,20 +1,22 @@
+import logging
 import utils.logz
-mylog = utils.logz.init_logfile('logs\\', __file__).getChild('test')
+mylog = utils.logz.init_logfile('logs', __file__, child='test', level=logging.DEBUG) # Opt in to debug messages.
 
-mylog.info('Loading '  + mylog.name + '.')
+mylog.info('Loading %s.', mylog.name)
 
-import mdl_a
-import mdl_b
-import mdl_z
-import pkg_a.mdl_a
-import pkg_a.mdl_b
-import pkg_a.mdl_z
-import pkg_b.mdl_a
-import pkg_b.mdl_b
-import pkg_b.mdl_z
-import pkg_z.mdl_a
-import pkg_z.mdl_b
-import pkg_z.mdl_z
+import utils.lazy
+mdl_a = utils.lazy.lazy_import('mdl_a')
+mdl_b = utils.lazy.lazy_import('mdl_b')
+mdl_z = utils.lazy.lazy_import('mdl_z')
+pkg_a_mdl_a = utils.lazy.lazy_import('pkg_a.mdl_a')
+pkg_a_mdl_b = utils.lazy.lazy_import('pkg_a.mdl_b')
+pkg_a_mdl_z = utils.lazy.lazy_import('pkg_a.mdl_z')
+pkg_b_mdl_a = utils.lazy.lazy_import('pkg_b.mdl_a')
+pkg_b_mdl_b = utils.lazy.lazy_import('pkg_b.mdl_b')
+pkg_b_mdl_z = utils.lazy.lazy_import('pkg_b.mdl_z')
+pkg_z_mdl_a = utils.lazy.lazy_import('pkg_z.mdl_a')
+pkg_z_mdl_b = utils.lazy.lazy_import('pkg_z.mdl_b')
+pkg_z_mdl_z = utils.lazy.lazy_import('pkg_z.mdl_z')
 
 if __name__ == '__main__':
     try: # Code to execute, at least until an exception occurs
@@ -27,16 +29,16 @@ if __name__ == '__main__':
         mylog.warning('Message.')
         mylog.error('Message.')
         mylog.critical('Message.')
-        mylog.exception('Specified Exception Message.')
-        mylog.exception('🟥 Unspecified Exception Message.')
+        mylog.error('Specified Exception Message.')
+        mylog.error('🟥 Unspecified Exception Message.')
 
-        pkg_z.mdl_a.fnctn_b(pkg_z.mdl_z.var_z)
-        pkg_a.mdl_z.fnctn_a(pkg_b.mdl_a.var_b)
-        pkg_b.mdl_a.fnctn_z(pkg_z.mdl_z.var_z)
-        pkg_a.mdl_z.fnctn_a(mdl_z.var_z)
-        pkg_a.mdl_b.fnctn_a(pkg_z.mdl_a.var_a)
+        pkg_z_mdl_a.fnctn_b(pkg_z_mdl_z.var_z)
+        pkg_a_mdl_z.fnctn_a(pkg_b_mdl_a.var_b)
+        pkg_b_mdl_a.fnctn_z(pkg_z_mdl_z.var_z)
+        pkg_a_mdl_z.fnctn_a(mdl_z.var_z)
+        pkg_a_mdl_b.fnctn_a(pkg_z_mdl_a.var_a)
         mdl_z.fnctn_b(mdl_a.var_b)
-        mdl_z.fnctn_z(pkg_a.mdl_b.var_b)
+        mdl_z.fnctn_z(pkg_a_mdl_b.var_b)
         
         mylog.info('🟩 …Completed Actions.')
     # … optional code to handle specified exceptions …
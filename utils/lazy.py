@@ -0,0 +1,58 @@
+''' Import modules lazily, deferring module execution until first attribute access.
+
+PURPOSE: Reduce startup time when a script imports modules that it may not use.
+
+USAGE:
+    ~~~
+    import utils.lazy
+    pkg_a_mdl_z = utils.lazy.lazy_import('pkg_a.mdl_z') # Module code runs on first attribute access.
+
+    pkg_a_mdl_z.fnctn_a('Message.') # Loads pkg_a.mdl_z now, then calls fnctn_a.
+    ~~~
+
+REFERENCES:
+  - Python → Documentation
+      - The Python Standard Library
+          - importlib
+              - Implementing lazy imports -- https://docs.python.org/3/library/importlib.html#implementing-lazy-imports
+              - importlib.util.LazyLoader -- https://docs.python.org/3/library/importlib.html#importlib.util.LazyLoader
+          - sys.modules -- https://docs.python.org/3/library/sys.html#sys.modules
+'''
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    ''' Import module lazily; module code executes on first attribute access.
+
+    USAGE:
+    - pkg_a_mdl_z = utils.lazy.lazy_import('pkg_a.mdl_z')
+
+    INPUT:
+      - name (str) = absolute module name (e.g. 'pkg_a.mdl_z')
+
+    OUTPUT:
+      - module (types.ModuleType) = module, already loaded or loading deferred until first use
+
+    EXCEPTIONS:
+      - ModuleNotFoundError = module not found
+    '''
+    if name in sys.modules: # Module already imported (or lazily registered), so reuse it.
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name) # Note: eagerly imports parent packages, if any.
+    if spec is None:
+        raise ModuleNotFoundError('No module named ' + repr(name), name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    parent, _, child = name.rpartition('.')
+    if parent: # Bind to parent package like a normal import (e.g. pkg_a.mdl_z after `import pkg_a`).
+        setattr(sys.modules[parent], child, module)
+
+    return module
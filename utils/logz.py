@@ -7,13 +7,16 @@ USAGE:
   - Import: 
             ~~~
             import utils.logz
-            mylog = utils.logz.setup().getChild('module_name') # Log to stderr; see function usage notes.
+            mylog = utils.logz.setup(child='module_name') # Log info and above to stderr; see function usage notes.
             # OR
             import utils.logz
             logpath = 'path\\to\\log\\directory\\'
-            mylog = utils.logz.init_logfile(logpath, __file__).getChild('module_name') # Log to {logpath}\{module_name}-{timestamp}.log; see function usage notes.
+            mylog = utils.logz.init_logfile(logpath, __file__, child='module_name') # Log to {logpath}\{module_name}-{timestamp}.log; see function usage notes.
             
             [ … other imports and definitions … ]
+            # … other modules log through child loggers of the application logger (utils.logz.LOGGER_NAME):
+            #   mylog = utils.logz.get_logger(__name__) …
+            #   or, without importing utils.logz: mylog = logging.getLogger('app.' + __name__) …
 
             if __name__ == '__main__':            
                 try: # Code to execute, at least until an exception occurs
@@ -23,12 +26,19 @@ USAGE:
                     
                     # … user messages as needed …
                     print('🖐 Message to user.')
-                    mylog.debug('Message.')
-                    mylog.info('Message')
+                    mylog.debug('Message: x=%s, y=%s', x, y) # Pass arguments; formatted only if logged.
+                    mylog.info('Message: %s', x)
                     mylog.warning('Message.')
                     mylog.error('Message.')
                     mylog.critical('Message.')
-                    
+
+                    # … defer arguments that are expensive to build; the logger already skips
+                    #   disabled levels before creating a log record …
+                    mylog.debug('Details: %s', utils.logz.lazy(expensive_details)) # Called only if logged.
+                    # OR
+                    if mylog.isEnabledFor(logging.DEBUG):
+                        mylog.debug('Details: %s', expensive_details())
+
                     mylog.info('🟩 …Completed Actions.')
                 # … optional code to handle specified exceptions …
                 except Exception: # Code to handle unspecified exceptions
@@ -48,16 +58,45 @@ REFERENCES:
               - Logging -- https://docs.python.org/3/library/logging.html
               - .config — configuration -- https://docs.python.org/3/library/logging.config.html
               - .handlers — handlers -- https://docs.python.org/3/library/logging.handlers.html
-          - argparse -- command line use only, not required for import use -- https://docs.python.org/3/library/argparse.html
-          - datetime -- https://docs.python.org/3/library/datetime.html
+          - argparse -- command line use only, not required for import use; imported on demand -- https://docs.python.org/3/library/argparse.html
+          - io -- https://docs.python.org/3/library/io.html
           - os -- https://docs.python.org/3/library/os.html
           - platform -- https://docs.python.org/3/library/platform.html
+          - time -- https://docs.python.org/3/library/time.html
 '''
-import argparse
-import datetime
+import atexit
+import copy
+import functools
+import io
 import logging
+import logging.handlers
 import os
-import platform
+import queue
+import sys
+import threading
+import time
+
+
+# Name of the application logger that setup() configures; module loggers are its children
+# (see get_logger), so their log records reach its handlers.
+# Note: the example modules (e.g. pkg_a\mdl_z.py) use the literal 'app.' + __name__ so they do not depend on
+#       importing utils.logz; change them too if this name changes.
+LOGGER_NAME = 'app'
+
+
+def get_logger(name: str) -> logging.Logger:
+    ''' Get child logger of the application logger (LOGGER_NAME) for a module.
+
+    USAGE:
+    - mylog = utils.logz.get_logger(__name__) # e.g. app.pkg_a.mdl_z
+
+    INPUT:
+      - name (str) = module name (e.g. __name__)
+
+    OUTPUT:
+      - (logging.Logger) = logger instance named {LOGGER_NAME}.{name}
+    '''
+    return logging.getLogger(LOGGER_NAME + '.' + name)
 
 
 def get_cli_help():
@@ -69,6 +108,8 @@ def get_cli_help():
       - argparse -- used for command line only, not required for import use.
                     See https://docs.python.org/3/library/argparse.html
     '''
+    import argparse # Import on demand; only needed for command line use.
+
     parser = argparse.ArgumentParser(
         prog='logz',
         description='Initialize logging to file or stderr'
@@ -98,6 +139,10 @@ def get_cli_help():
                         action='store_true', dest='is_test_exception_unspecified',
                         help='optional flag to test unspecified exception handling'
     )
+    parser.add_argument('--debug',
+                        action='store_true', dest='debug',
+                        help='optional flag to log debug messages too (default: info and above)'
+    )
     parser.add_argument('logtype',
                         action='store', nargs=1, default=1, type=str, choices=['1', '2', '3'],
                         help='log output to... 1 = screen, 2 = logpath (see --logpath), or 3 = logpathfile (see --logpathfilename)'
@@ -105,7 +150,424 @@ def get_cli_help():
     return parser.parse_args()
 
 
-def setup(logfile_path_name: str | None = None) -> logging.Logger:
+class CachedTimeFormatter(logging.Formatter):
+    ''' Formatter that reuses the formatted time (asctime) for log records created within the same second.
+
+    PURPOSE: Skip time.strftime for each log record when datefmt has one-second resolution (e.g. '%Y-%m-%d %H:%M:%S %z').
+             All instances share one cache, so fyi and alert formatters with the same datefmt format each second once.
+
+    USAGE:
+    - handler.setFormatter(CachedTimeFormatter(fmt, datefmt))
+    '''
+    _cached_time = (-1, None, None, '') # (whole second, datefmt, converter, formatted time) of most recent log record
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        ''' Format log record creation time, reusing the result for the same whole second.
+
+        INPUT:
+        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+        - datefmt (str)(optional) = time.strftime format; if omitted, default format with milliseconds, not cached
+
+        OUTPUT:
+        - (str) = formatted time
+        '''
+        if datefmt is None: # Default format includes milliseconds, so each record differs.
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_datefmt, cached_converter, cached_time = CachedTimeFormatter._cached_time
+        if second != cached_second or datefmt != cached_datefmt or self.converter is not cached_converter:
+            cached_time = super().formatTime(record, datefmt)
+            CachedTimeFormatter._cached_time = (second, datefmt, self.converter, cached_time) # Replace all values at once; safe across threads.
+
+        return cached_time
+
+
+class DualFormatter(logging.Formatter):
+    ''' Formatter that selects the fyi or alert layout based on log record level.
+
+    PURPOSE: Let one handler write both fyi (e.g. debug, info) and alert (e.g. warning, error,
+             critical) messages, instead of one filtered handler per layout.
+
+    USAGE:
+    - handler.setFormatter(DualFormatter(logging.Formatter(fmt_fyi, datefmt), logging.Formatter(fmt_alert, datefmt)))
+
+    INPUT:
+    - formatter_fyi (logging.Formatter) = formatter for records with level less than warning level
+    - formatter_alert (logging.Formatter) = formatter for records with level greater than or equal to warning level
+    '''
+    def __init__(self, formatter_fyi: logging.Formatter, formatter_alert: logging.Formatter) -> None:
+        super().__init__()
+        self.formatter_fyi = formatter_fyi
+        self.formatter_alert = formatter_alert
+
+
+    def format(self, record: logging.LogRecord) -> str:
+        ''' Format log record with the alert formatter if level ≥ warning level, otherwise the fyi formatter.
+
+        INPUT:
+        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+
+        OUTPUT:
+        - (str) = formatted log record message
+        '''
+        if record.levelno >= 30: # logging.WARNING value
+            return self.formatter_alert.format(record)
+        return self.formatter_fyi.format(record)
+
+
+class JSONFormatter(logging.Formatter):
+    ''' Formatter that writes each log record as one line of JSON (e.g. for log processing tools).
+
+    PURPOSE: Serialize selected log record fields in one call, with orjson if installed (faster), otherwise
+             with the standard json module; either is imported on demand, only when this formatter is used.
+
+    USAGE:
+    - mylog = utils.logz.setup(logpathfilename, json=True) # Or handler.setFormatter(JSONFormatter())
+    '''
+    def __init__(self) -> None:
+        super().__init__()
+        try:
+            import orjson # Optional; see https://github.com/ijl/orjson
+            self._dumps = lambda obj: orjson.dumps(obj).decode()
+        except ImportError:
+            import json
+            self._dumps = functools.partial(json.dumps, ensure_ascii=False)
+
+
+    def format(self, record: logging.LogRecord) -> str:
+        ''' Format log record as JSON object with time (t), level (lvl), logger name (name), message (msg),
+            contextual color flag (flag), and exception details (exc) if any.
+
+        INPUT:
+        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+
+        OUTPUT:
+        - (str) = JSON object on one line
+        '''
+        log_entry = {
+            't': record.created,
+            'lvl': record.levelname,
+            'name': record.name,
+            'msg': record.getMessage(),
+            'flag': getattr(record, 'cntxt_flag', ''),
+        }
+        if record.exc_info:
+            log_entry['exc'] = self.formatException(record.exc_info)
+
+        return self._dumps(log_entry)
+
+
+class FastLogger(logging.Logger):
+    ''' Logger that skips caller lookup (e.g. pathname, funcName, lineno) for fyi messages (e.g. debug, info)
+        of the application logger (LOGGER_NAME) and its children.
+
+    PURPOSE: Only the alert formats include caller details, so avoid walking the call stack for each
+             fyi log record; alert messages (e.g. warning, error, critical) still include them. Other
+             loggers (e.g. third-party libraries) log as usual, since their handlers may use caller details.
+
+    USAGE:
+    - logging.setLoggerClass(FastLogger) # Done on import of utils.logz, before loggers are created (e.g. logging.getLogger(__name__))
+    '''
+    def __init__(self, name: str, level: int = logging.NOTSET) -> None:
+        super().__init__(name, level)
+        self._is_app = name == LOGGER_NAME or name.startswith(LOGGER_NAME + '.') # Logger name is fixed, so check once.
+
+
+    def debug(self, msg: object, *args, **kwargs) -> None:
+        ''' Log message with debug level, without caller details for application loggers. See logging.Logger.debug. '''
+        if self.isEnabledFor(logging.DEBUG):
+            if self._is_app:
+                self._log_fyi(logging.DEBUG, msg, args, **kwargs)
+            else: # Log with caller details as usual, like logging.Logger.debug.
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + 1 # Skip this method when finding caller.
+                self._log(logging.DEBUG, msg, args, **kwargs)
+
+
+    def info(self, msg: object, *args, **kwargs) -> None:
+        ''' Log message with info level, without caller details for application loggers. See logging.Logger.info. '''
+        if self.isEnabledFor(logging.INFO):
+            if self._is_app:
+                self._log_fyi(logging.INFO, msg, args, **kwargs)
+            else: # Log with caller details as usual, like logging.Logger.info.
+                kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + 1 # Skip this method when finding caller.
+                self._log(logging.INFO, msg, args, **kwargs)
+
+
+    def _log_fyi(self, level: int, msg: object, args: tuple, exc_info=None, extra: dict | None = None,
+                 stack_info: bool = False, stacklevel: int = 1) -> None:
+        ''' Create log record without caller details and call handlers; same as logging.Logger._log otherwise.
+
+        INPUT:
+        - level (int) = log record level (e.g. logging.DEBUG)
+        - msg, args, exc_info, extra, stack_info, stacklevel = see https://docs.python.org/3/library/logging.html#logging.Logger.debug
+
+        OUTPUT:
+        - NONE (calls handlers)
+        '''
+        if stack_info: # Stack requested, so find caller as usual; skip this method and debug/info.
+            self._log(level, msg, args, exc_info, extra, stack_info, stacklevel + 2)
+            return
+
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = self.makeRecord(self.name, level, '(unknown file)', 0, msg, args, exc_info, '(unknown function)', extra)
+        self.handle(record)
+
+
+class _Lazy:
+    ''' Log message argument that calls a function only when the log record message is formatted.
+
+    USAGE: See lazy.
+    '''
+    __slots__ = ('_fn',)
+
+    def __init__(self, fn) -> None:
+        self._fn = fn
+
+
+    def __str__(self) -> str:
+        return str(self._fn())
+
+
+    def __repr__(self) -> str:
+        return repr(self._fn())
+
+
+def lazy(fn) -> _Lazy:
+    ''' Defer building an expensive log message argument until the message is logged.
+
+    USAGE:
+    - mylog.debug('Details: %s', utils.logz.lazy(expensive_details)) # expensive_details() not called if debug disabled
+
+    INPUT:
+      - fn (callable) = function without arguments that returns the message argument (e.g. lambda: repr(data))
+
+    OUTPUT:
+      - (_Lazy) = log message argument; calls fn when formatted with %s or %r
+    '''
+    return _Lazy(fn)
+
+
+# Use FastLogger for all loggers created from now on (e.g. logging.getLogger(__name__) in modules imported
+# after utils.logz), so fyi messages skip caller lookup even before setup() is called.
+# See https://docs.python.org/3/library/logging.html#logging.setLoggerClass
+logging.setLoggerClass(FastLogger)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    ''' File handler that writes log records through an 8 KiB buffer instead of flushing after each one.
+
+    PURPOSE: Reduce write system calls; the buffer is written to disk when full, after an alert record
+             (e.g. warning, error, critical), by flush_now, or when the handler closes (e.g. term_logfile or exit).
+
+    USAGE:
+    - handler = BufferedFileHandler('path\\to\\filename.log', mode='a', encoding='utf-8')
+
+    Note: logfile lines end with '\n' on all platforms (no newline translation), including on Windows.
+    '''
+    buffer_size = 8192 # bytes
+
+    def _open(self):
+        ''' Open log file in binary mode with buffer_size buffer, wrapped for text without newline translation
+            (i.e. '\n' on all platforms, no '\r\n' on Windows). See logging.FileHandler._open.
+        '''
+        stream_raw = open(self.baseFilename, self.mode.replace('b', '') + 'b', buffering=self.buffer_size)
+        return io.TextIOWrapper(stream_raw, encoding=self.encoding, errors=self.errors, newline='', write_through=False)
+
+
+    def format(self, record: logging.LogRecord) -> str:
+        ''' Return preformatted log record text as is (see log_fast), otherwise format log record. See logging.Handler.format. '''
+        preformatted = getattr(record, '_preformatted', None)
+        if preformatted is not None and not isinstance(self.formatter, JSONFormatter): # Keep JSON lines valid.
+            return preformatted
+        return super().format(record)
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        ''' Write log record to buffer; write buffer to disk after alert records. See logging.FileHandler.emit. '''
+        super().emit(record)
+        if record.levelno >= 30: # logging.WARNING value
+            try:
+                self.flush_now()
+            except Exception: # e.g. disk full; report like logging.StreamHandler.emit, so the listener thread keeps running.
+                self.handleError(record)
+
+
+    def flush(self) -> None:
+        ''' Skip flushing after each log record (called by logging.StreamHandler.emit); see flush_now. '''
+
+
+    def flush_now(self) -> None:
+        ''' Write buffered log records to disk. '''
+        super().flush()
+
+
+def log_fast(logger: logging.Logger, level: int, preformatted: str) -> None:
+    ''' Log fixed, already formatted text to logfile without formatter (e.g. hot path info messages).
+
+    PURPOSE: Skip message interpolation, timestamp, and format work for messages that are logged often
+             and never change; the logfile gets preformatted text as is, with no timestamp or logger name.
+
+    USAGE:
+    - _LOOP_MSG = '\n⬛ Processed batch.' # Build once, e.g. at module level.
+    - utils.logz.log_fast(mylog, logging.INFO, _LOOP_MSG)
+
+    INPUT:
+      - logger (logging.Logger) = logger instance (e.g. mylog)
+      - level (int) = log record level (e.g. logging.INFO)
+      - preformatted (str) = text written to logfile followed by a newline; also the message for other handlers (e.g. stderr)
+
+    Note: with setup(..., json=True), the logfile gets a JSON line with preformatted as its message (msg) instead.
+
+    OUTPUT:
+      - NONE (calls handlers)
+    '''
+    if logger.isEnabledFor(level):
+        record = logger.makeRecord(logger.name, level, '(unknown file)', 0, preformatted, None, None, '(unknown function)')
+        record._preformatted = preformatted
+        logger.handle(record)
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    ''' Queue handler for a queue read in the same process (e.g. by logging.handlers.QueueListener).
+
+    PURPOSE: Keep exception info on queued log records, so alert formats still show it, because the
+             records are never pickled; only merge the message and its arguments before queuing.
+
+    USAGE:
+    - logger.addHandler(LocalQueueHandler(queue.SimpleQueue()))
+    '''
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        ''' Copy log record with message merged, so later changes to message arguments do not affect it.
+
+        INPUT:
+        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+
+        OUTPUT:
+        - record (logging.LogRecord) = log record copy to queue
+        '''
+        record = copy.copy(record) # Copy to avoid affecting other handlers of the same record.
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+
+        return record
+
+
+_base_record_factory = logging.getLogRecordFactory() # Default log record factory, before record_factory replaces it.
+
+# Contextual color character flags (cntxt_flag) by log record level number: index = levelno // 10 - 1
+# (e.g. debug, info, warning, error, critical); custom levels take the flag of the standard level below them.
+_CNTXT_FLAGS = ('⚪', '⬛', '🟧', '🟥', '🟥🟥')
+
+
+def record_factory(*args, **kwargs) -> logging.LogRecord:
+    ''' Log record factory that adds contextual color character flag (cntxt_flag) to each log record
+        (e.g. ⚪, ⬛, 🟧, 🟥, 🟥🟥), plus thread and process details only to alert records (e.g. warning, error, critical)
+        of application loggers (LOGGER_NAME), and to all records of other loggers (e.g. third-party libraries).
+
+    PURPOSE: Set cntxt_flag once when the log record is created, instead of in a filter on each handler.
+             Only the alert formats include %(threadName)s and %(processName)s, so skip looking them up
+             for every application fyi record (e.g. debug, info); the logging module's own lookups are
+             turned off below. Other loggers' handlers may use them at any level, so keep them there.
+
+    USAGE:
+    - logging.setLogRecordFactory(record_factory)
+
+    INPUT:
+    - args, kwargs = log record arguments -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+
+    OUTPUT:
+    - record (logging.LogRecord) = log record instance
+    '''
+    record = _base_record_factory(*args, **kwargs)
+    flag_index = record.levelno // 10 - 1
+    record.cntxt_flag = _CNTXT_FLAGS[flag_index] if 0 <= flag_index < 5 else ''
+    is_app = record.name == LOGGER_NAME or record.name.startswith(LOGGER_NAME + '.')
+    if record.levelno >= 30 or not is_app: # logging.WARNING value
+        record.thread = threading.get_ident()
+        record.threadName = threading.current_thread().name
+        record.process = os.getpid()
+        mp = sys.modules.get('multiprocessing') # Same lookup as logging.LogRecord; avoids importing multiprocessing.
+        record.processName = 'MainProcess' if mp is None else mp.current_process().name
+    if not is_app and hasattr(record, 'taskName'): # Python 3.12+; same lookup as logging.LogRecord.
+        asyncio = sys.modules.get('asyncio')
+        if asyncio:
+            try:
+                record.taskName = asyncio.current_task().get_name()
+            except Exception:
+                pass
+
+    return record
+
+
+# Use record_factory for all log records created from now on, and skip the logging module's own thread and
+# process lookups for each log record; record_factory adds them back where needed (see record_factory).
+# See https://docs.python.org/3/howto/logging.html#optimization
+logging.setLogRecordFactory(record_factory)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+if hasattr(logging, 'logAsyncioTasks'): # Python 3.12+
+    logging.logAsyncioTasks = False
+
+
+# Create date format for all formatters.
+# See https://docs.python.org/3/library/time.html#time.strftime
+_DATEFMT = '%Y-%m-%d %H:%M:%S %z'
+
+# Create different log record formats for various handler formatters.
+# See https://docs.python.org/3/library/logging.html#logrecord-attributes
+# For stderr, omit contextual color flag.
+_FMT_STDERR_FYI = (
+    '\n'
+    '%(asctime)s - %(name)s - %(levelname)s: %(message)s'
+)
+_FMT_STDERR_ALERT = (
+    '\n'
+    '%(message)s \n'
+    '%(asctime)s - %(name)s - %(levelname)s \n'
+    '%(threadName)s → %(processName)s \n'
+    '%(pathname)s \n'
+    '→ %(module)s → %(funcName)s @ %(lineno)d \n'
+    'EXCEPTION INFO: %(exc_info)s \n'
+)
+# For file, include contextual color flag.
+_FMT_FILE_FYI = (
+    '\n'
+    '%(asctime)s - %(name)s - %(cntxt_flag)s %(levelname)s: %(message)s'
+)
+_FMT_FILE_ALERT = (
+    '\n'
+    '%(cntxt_flag)s %(message)s \n'
+    '%(asctime)s - %(name)s - %(levelname)s \n'
+    '%(threadName)s → %(processName)s \n'
+    '%(pathname)s \n'
+    '→ %(module)s → %(funcName)s @ %(lineno)d \n'
+    'EXCEPTION INFO: %(exc_info)s \n'
+)
+
+# Create formatters once for all handlers; each selects the fyi or alert format by record level.
+# See https://docs.python.org/3/howto/logging.html#formatters
+_FORMATTER_STDERR = DualFormatter(
+    CachedTimeFormatter(_FMT_STDERR_FYI, _DATEFMT),
+    CachedTimeFormatter(_FMT_STDERR_ALERT, _DATEFMT)
+)
+_FORMATTER_FILE = DualFormatter(
+    CachedTimeFormatter(_FMT_FILE_FYI, _DATEFMT),
+    CachedTimeFormatter(_FMT_FILE_ALERT, _DATEFMT)
+)
+
+
+_setup_key = None # Arguments of current setup() configuration, if any.
+
+
+def setup(logfile_path_name: str | None = None, child: str | None = None, level: int = logging.INFO,
+          json: bool = False) -> logging.Logger:
     ''' Initialize logging to file or stderr (e.g. info, debug, warning, error, critical).
 
     PURPOSE: Store or display helpful log record messages for testing and debugging.
@@ -113,10 +575,10 @@ def setup(logfile_path_name: str | None = None) -> logging.Logger:
     USAGE:
         ~~~
         import utils.logz
-        mylog = utils.logz.setup().getChild('module_name') # to stderr
+        mylog = utils.logz.setup(child='module_name') # to stderr
         # OR
         logpathfilename = 'path\\to\\filename.log'
-        utils.logz.setup(logpathfilename).getChild('module_name') # to path\to\filename.log
+        mylog = utils.logz.setup(logpathfilename, child='module_name') # to path\to\filename.log
 
         [ … other imports and definitions … ]
 
@@ -128,8 +590,8 @@ def setup(logfile_path_name: str | None = None) -> logging.Logger:
                 
                 # … user messages as needed …
                 print('🖐 Message to user.')
-                mylog.debug('Message.')
-                mylog.info('Message')
+                mylog.debug('Message: x=%s, y=%s', x, y) # Pass arguments; formatted only if logged.
+                mylog.info('Message: %s', x)
                 mylog.warning('Message.')
                 mylog.error('Message.')
                 mylog.critical('Message.')
@@ -142,176 +604,167 @@ def setup(logfile_path_name: str | None = None) -> logging.Logger:
     INPUT:
       - logfile_path_name (str)(optional) = path and name of log file, if omitted stream to stderr
                                             (e.g. D:\\path\\name.log)
+      - child (str)(optional) = child logger name, if omitted return configured logger (e.g. 'module_name')
+      - level (int)(optional) = lowest level to log, if omitted logging.INFO; pass logging.DEBUG to opt in to debug messages
+      - json (bool)(optional) = true to write all messages as JSON lines (see JSONFormatter) to logfile, or to stderr
+                                if no logfile; stderr alerts for a logfile stay human readable
 
     OUTPUT:
-      - mylog (logging.Logger) = logger instance
+      - mylog (logging.Logger) = application logger instance (LOGGER_NAME), named child logger if child given
     '''
-    # Define filter functions
-    def filter_fyi(record: logging.LogRecord) -> bool:
-        '''
-        Filter to accept log records with level less than warning level, otherwise ignore.
+    global _setup_key
 
-        USAGE: 
-        - handler.addFilter(filter_fyi)
+    # Reuse configuration if already set up the same way (e.g. repeated calls or imports) and its background
+    # logging thread is still running (i.e. not stopped by stop_listeners).
+    setup_key = (logfile_path_name, level, json)
+    mylog = logging.getLogger(LOGGER_NAME)
+    if setup_key == _setup_key and any(getattr(handler, 'listener', None) is not None for handler in mylog.handlers):
+        return mylog.getChild(child) if child else mylog
 
-        INPUT:
-        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+    # Stop background logging thread from any previous setup() call and close its handlers (e.g. logfile).
+    reset()
 
-        OUTPUT:
-        - (bool) = true to accept, false to ignore
-        '''
-        return record.levelno < 30 # logging.WARNING value
-    
+    handlers = [] # Listener handlers for all log record messages.
 
-    def filter_alert(record: logging.LogRecord) -> bool:
-        '''
-        Filter to accept log records with level greater than or equal to warning level, otherwise ignore.
+    if logfile_path_name == None: # Log all messages to stderr only.
+        # Create logger handler to stderr for all messages (e.g. debug, info, warning, error, and critical).
+        # See https://docs.python.org/3/library/logging.handlers.html
+        handler_stderr = logging.StreamHandler() # Create handler.
+        handler_stderr.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
+        handler_stderr.setFormatter(JSONFormatter() if json else _FORMATTER_STDERR) # Set handler formatter: JSON, or fyi or alert format by level.
+        handlers.append(handler_stderr) # Add handler to list for listener.
 
-        USAGE: 
-        - handler.addFilter(filter_alert)
+    else: # Log all messages to logfile, plus alerts to stderr.
+        # Create single logger handler to logfile for all messages (e.g. debug, info, warning, error, and critical).
+        # See https://docs.python.org/3/library/logging.handlers.html
+        handler_file = BufferedFileHandler(logfile_path_name, mode='a', encoding='utf-8') # Create handler: writes through 8 KiB buffer.
+        handler_file.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
+        handler_file.setFormatter(JSONFormatter() if json else _FORMATTER_FILE) # Set handler formatter: JSON, or fyi or alert format by level.
+
+        # Buffer logfile records in memory and write them in batches: when the buffer is full, when an
+        # alert message arrives, or when the handler closes (e.g. at exit or via term_logfile).
+        # Note: if the process crashes hard, buffered fyi messages since the last write may be lost;
+        #       lower flushLevel (e.g. logging.INFO) if every message must reach disk immediately.
+        # See https://docs.python.org/3/library/logging.handlers.html#memoryhandler
+        handler_file_buffer = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.WARNING, target=handler_file, flushOnClose=True
+        ) # Create handler.
+        handler_file_buffer.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
+        handlers.append(handler_file_buffer) # Add handler to list for listener.
+
+        # Create logger handler to stderr for alert messages (e.g. warning, error, and critical).
+        # See https://docs.python.org/3/library/logging.handlers.html
+        # See https://docs.python.org/3/library/logging.html#logging.Handler.setLevel
+        handler_stderr_alert = logging.StreamHandler() # Create handler.
+        handler_stderr_alert.setLevel(logging.WARNING) # Set handler level ≥ warning level; no filter needed (i.e. only warning, error, and critical).
+        handler_stderr_alert.setFormatter(_FORMATTER_STDERR) # Set handler formatter.
+        handlers.append(handler_stderr_alert) # Add handler to list for listener.
+
+    # Queue all log records for a background thread that passes them to the handlers above, which filter,
+    # format, and write them; so logging calls do not wait on stderr or file I/O. The listener checks each
+    # handler's level (respect_handler_level). term_logfile (or exit) stops the thread after it handles queued records.
+    # See https://docs.python.org/3/howto/logging-cookbook.html#dealing-with-handlers-that-block
+    # Note: queue.SimpleQueue (implemented in C, unbounded, no task tracking) is cheaper per log record than
+    #       queue.Queue, trading back-pressure for speed; acceptable since the application bounds log volume.
+    #       Logging from other processes would need multiprocessing.Queue instead.
+    #       See https://docs.python.org/3/library/queue.html#queue.SimpleQueue
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    handler_queue = LocalQueueHandler(log_queue) # Create handler.
+    handler_queue.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
+    handler_queue.listener = listener # Keep listener with its handler (like Python 3.12+ logging.config) to stop it later.
+    listener.start() # Start background thread.
+
+    # Configure application logger instance (not the root logger shared with other libraries) with the queue
+    # handler only; reset() above removed handlers left from any previous setup() call. Messages below the
+    # logger level (e.g. debug by default) are dropped by the logger's cached level check before any log
+    # record is created. propagate=False keeps application log records away from root logger handlers.
+    # See https://docs.python.org/3/howto/logging.html#logging-flow
+    #     https://docs.python.org/3/library/logging.html#logging.Logger.propagate
+    mylog = logging.getLogger(LOGGER_NAME) # Get application logger instance.
+    mylog.setLevel(level) # Set logger level ≥ level (e.g. info).
+    mylog.addHandler(handler_queue)
+    mylog.propagate = False
+    _setup_key = setup_key
 
-        INPUT:
-        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+    # Return mylog instance, or its named child (e.g. module_name) if requested.
+    return mylog.getChild(child) if child else mylog
 
-        OUTPUT:
-        - (bool) = true to accept, false to ignore
-        '''
-        # Because child handlers do not check message level, do it here:
-        # See https://www.electricmonk.nl/log/2017/08/06/understanding-pythons-logging-module/
-        return record.levelno >= 30 # logging.WARNING value
-    
 
-    def filter_add_cntxt(record: logging.LogRecord) -> bool:
-        ''' Filter to add contextual color character flag (cntxt_flag) to LogRecord (e.g. ⚪, ⬛, 🟧, 🟥, 🟥🟥)
+def reset() -> None:
+    ''' Remove logging configuration created by setup, so the next setup call configures logging again (e.g. in tests).
 
-        USAGE: 
-        - logger.addFilter(filter_add_cntxt)
+    OUTPUT:
+      - NONE (writes queued and buffered log records, then closes and removes application logger handlers)
+    '''
+    global _setup_key
 
-        INPUT:
-        - record (logging.LogRecord) = log record instance -- see https://docs.python.org/3/library/logging.html#logging.LogRecord
+    stop_listeners(close=True)
+    mylog = logging.getLogger(LOGGER_NAME)
+    for handler in mylog.handlers[:]:
+        mylog.removeHandler(handler)
+        handler.close()
+    mylog.propagate = True # Restore default, so log records reach root logger handlers again (e.g. lastResort).
+    _setup_key = None
 
-        OUTPUT:
-        - (bool) = true to accept all records
-        '''
-        match record.levelname:
-            case 'DEBUG':
-                record.cntxt_flag = '⚪'
-            case 'INFO':
-                record.cntxt_flag = '⬛'
-            case 'WARNING':
-                record.cntxt_flag = '🟧'
-            case 'ERROR':
-                record.cntxt_flag = '🟥'
-            case 'CRITICAL':
-                record.cntxt_flag = '🟥🟥'
-            case _:
-                record.cntxt_flag = ''
-        
-        return True # accept all records
-        
 
-    # Create logger instance for all log record messages.
-    # See https://docs.python.org/3/howto/logging.html#logging-flow
-    #     https://docs.python.org/3/howto/logging.html#loggers
-    mylog = logging.getLogger() # Create logger instance.
-    mylog.setLevel(logging.DEBUG) # Set logger level ≥ debug level.
-    # No logger filter needed.
-
-    # Create date format for all formatters.
-    # See https://docs.python.org/3/library/time.html#time.strftime
-    datefmt = '%Y-%m-%d %H:%M:%S %z'
-    
-    # Create different log record formats for various handler formatters.
-    # See https://docs.python.org/3/library/logging.html#logrecord-attributes
-    # For stderr, omit contextual color flag.
-    fmt_stderr_fyi = (
-        '\n'
-        '%(asctime)s - %(name)s - %(levelname)s: %(message)s'
-    )
-    fmt_stderr_alert = (
-        '\n'
-        '%(message)s \n'
-        '%(asctime)s - %(name)s - %(levelname)s \n'
-        '%(threadName)s → %(processName)s \n'
-        '%(pathname)s \n'
-        '→ %(module)s → %(funcName)s @ %(lineno)d \n'
-        'EXCEPTION INFO: %(exc_info)s \n'
-    )
-    # For file, include contextual color flag.
-    fmt_file_fyi = (
-        '\n'
-        '%(asctime)s - %(name)s - %(cntxt_flag)s %(levelname)s: %(message)s'
-    )
-    fmt_file_alert = (
-        '\n'
-        '%(cntxt_flag)s %(message)s \n'
-        '%(asctime)s - %(name)s - %(levelname)s \n'
-        '%(threadName)s → %(processName)s \n'
-        '%(pathname)s \n'
-        '→ %(module)s → %(funcName)s @ %(lineno)d \n'
-        'EXCEPTION INFO: %(exc_info)s \n'
-    )
+def stop_listeners(close: bool = False) -> None:
+    ''' Stop background logging threads after they handle queued log records, then write buffered log records.
 
-    # Create formatters for handlers.
-    # See https://docs.python.org/3/howto/logging.html#formatters
-    formatter_stderr_fyi = logging.Formatter(fmt_stderr_fyi, datefmt)
-    formatter_stderr_alert = logging.Formatter(fmt_stderr_alert, datefmt)
-    
-    formatter_file_fyi = logging.Formatter(fmt_file_fyi, datefmt)
-    formatter_file_alert = logging.Formatter(fmt_file_alert, datefmt)
+    USAGE: Called by reset (e.g. via setup and term_logfile) and at exit; safe to call more than once.
+           Log records after this call are dropped until setup is called again, which then reconfigures logging.
 
-    if logfile_path_name == None: # Log all messages to stderr only.
-        # Create logger handler to stderr for fyi messages (e.g. debug and info).
-        # See https://docs.python.org/3/library/logging.handlers.html
-        # See https://docs.python.org/3/library/logging.html#filter-objects
-        handler_stderr_fyi = logging.StreamHandler() # Create handler.
-        handler_stderr_fyi.setLevel(logging.DEBUG) # Set handler level ≥ debug level.
-        handler_stderr_fyi.addFilter(filter_fyi) # Add handler filter: < warning level (i.e. only debug and info).
-        handler_stderr_fyi.setFormatter(formatter_stderr_fyi) # Set handler formatter.
-        mylog.addHandler(handler_stderr_fyi) # Add handler to logger instance.
-        
-    else: # Log all messages to logfile, plus alerts to stderr.
-        # Create logger handler to logfile for fyi messages (e.g. debug and info).
-        # See https://docs.python.org/3/library/logging.handlers.html
-        # See https://docs.python.org/3/library/logging.html#filter-objects
-        handler_file_fyi = logging.FileHandler(logfile_path_name, mode='a', encoding='utf-8') # Create handler.
-        handler_file_fyi.setLevel(logging.DEBUG) # Set handler level.
-        handler_file_fyi.addFilter(filter_fyi) # Add handler filter: allow only fyi messages (e.g. debug and info).
-        handler_file_fyi.addFilter(filter_add_cntxt) # Add handler filter: add contextual color flag.
-        handler_file_fyi.setFormatter(formatter_file_fyi) # Set handler formatter.
-        mylog.addHandler(handler_file_fyi) # Add handler to logger instance.
-       
-        # Create logger handler to logfile for alert messages (e.g. warning, error, and critical).
-        # See https://docs.python.org/3/library/logging.handlers.html
-        # See https://docs.python.org/3/library/logging.html#filter-objects
-        handler_file_alert = logging.FileHandler(logfile_path_name, mode='a', encoding='utf-8') # Create handler.
-        handler_file_alert.setLevel(logging.WARNING) # Set handler level.
-        handler_file_alert.addFilter(filter_alert) # Add handler filter: allow only alert messages (e.g. warning, error, and critical).
-        handler_file_alert.addFilter(filter_add_cntxt) # Add handler filter: add contextual color flag.
-        handler_file_alert.setFormatter(formatter_file_alert) # Set handler formatter.
-        mylog.addHandler(handler_file_alert) # Add handler to logger instance.
-    
-    # Create logger handler to stderr for alert messages (e.g. warning, error, and critical).
-    # See https://docs.python.org/3/library/logging.handlers.html
-    # See https://docs.python.org/3/library/logging.html#filter-objects
-    handler_stderr_alert = logging.StreamHandler() # Create handler.
-    handler_stderr_alert.setLevel(logging.WARNING) # Set handler level ≥ warning level.
-    handler_stderr_alert.addFilter(filter_alert) # Add handler filter: allow only alert messages (e.g. warning, error, and critical).
-    handler_stderr_alert.setFormatter(formatter_stderr_alert) # Set handler formatter.
-    mylog.addHandler(handler_stderr_alert) # Add handler to logger instance.
+    INPUT:
+      - close (bool)(optional) = true to also close the listeners' handlers and their targets (e.g. logfile),
+                                 which writes logfile buffers to disk; otherwise logging.shutdown does so at exit
+
+    OUTPUT:
+      - NONE (writes queued and buffered log records)
+    '''
+    for handler in logging.getLogger(LOGGER_NAME).handlers:
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            handler.listener = None # Stop each listener only once.
+            listener.stop() # Handle queued log records, then stop background thread.
+            for listener_handler in listener.handlers:
+                if close:
+                    target = getattr(listener_handler, 'target', None) # e.g. MemoryHandler writes to target
+                    listener_handler.close() # Close handler; MemoryHandler writes buffered log records first.
+                    if target is not None:
+                        target.close()
+                else:
+                    listener_handler.flush()
+
+
+# Stop background logging threads at exit; runs before logging.shutdown, which was registered earlier.
+atexit.register(stop_listeners)
 
-    # Return mylog instance.
-    return mylog
 
+@functools.lru_cache(maxsize=1)
+def _host_banner() -> str:
+    ''' Build logfile header host details once per process, then reuse (e.g. for repeated init_logfile calls).
 
-def init_logfile(logpath: str, filepathname: str) -> logging.Logger:
+    OUTPUT:
+      - (str) = operating system and Python version lines, each ending with a newline
+    '''
+    import platform # Import on demand to keep `import utils.logz` light.
+
+    return (f'OPERATING SYSTEM: {platform.uname()}\n'
+            f'PYTHON VERSION:: {platform.python_version()}\n'
+            )
+
+
+_ENDING_BANNER = '\n========== ENDING ==========\nFILE: ' # Logfile footer, followed by module file path and name.
+
+
+def init_logfile(logpath: str, filepathname: str, child: str | None = None, level: int = logging.INFO) -> logging.Logger:
     ''' Setup logging to file in {logpath}\{module_name}-{timestamp}.log
 
     USAGE:
         ~~~
         import utils.logz
         logpath = 'path\\to\\log\\directory\\'
-        mylog = utils.logz.init_logfile(logpath, __file__).getChild('module_name') # to {logpath}\{module_name}-{timestamp}.log
+        mylog = utils.logz.init_logfile(logpath, __file__, child='module_name') # to {logpath}\{module_name}-{timestamp}.log
 
         [ … other imports and definitions … ]
 
@@ -323,8 +776,8 @@ def init_logfile(logpath: str, filepathname: str) -> logging.Logger:
                 
                 # … user messages as needed …
                 print('🖐 Message to user.')
-                mylog.debug('Message.')
-                mylog.info('Message')
+                mylog.debug('Message: x=%s, y=%s', x, y) # Pass arguments; formatted only if logged.
+                mylog.info('Message: %s', x)
                 mylog.warning('Message.')
                 mylog.error('Message.')
                 mylog.critical('Message.')
@@ -338,24 +791,22 @@ def init_logfile(logpath: str, filepathname: str) -> logging.Logger:
         ~~~
 
     INPUT:
-      - logpath (str) = path to directory for log file (e.g. 'D:\\application\\logs\\')
+      - logpath (str) = path to directory for log file, trailing separator optional (e.g. 'D:\\application\\logs\\')
       - modulefilepathname (str) = module file path and name (e.g. __file__)
+      - child (str)(optional) = child logger name, if omitted return configured logger (e.g. 'module_name')
+      - level (int)(optional) = lowest level to log, if omitted logging.INFO; pass logging.DEBUG to opt in to debug messages
 
     OUTPUT:
-      - mylog (logging.Logger) = logger instance
+      - mylog (logging.Logger) = logger instance, named child logger if child given
     '''
-    start_time = datetime.datetime.now()
-    log_filename = logpath + os.path.basename(filepathname).split('.')[0] + '-' + start_time.strftime('%Y%m%d%H%M%S') + '.log'
-    mylog = setup(log_filename)
-    mylog.info('\n'
-                'OPERATING SYSTEM: ' + str(platform.uname()) + '\n'
-                'PYTHON VERSION:: ' + str(platform.python_version()) + '\n'
-                'FILE: ' + filepathname + '\n'
-                '========== STARTING =========='
-                )
+    start_time = time.strftime('%Y%m%d%H%M%S') # Local time, e.g. 20230909161620
+    module_name = os.path.splitext(os.path.basename(filepathname))[0]
+    log_filename = os.path.join(logpath, f'{module_name}-{start_time}.log')
+    mylog = setup(log_filename, level=level)
+    mylog.info(f'\n{_host_banner()}FILE: {filepathname}\n========== STARTING ==========')
 
-    # Return mylog instance.
-    return mylog
+    # Return mylog instance, or its named child (e.g. module_name) if requested.
+    return mylog.getChild(child) if child else mylog
 
 
 def term_logfile(logger: logging.Logger, filename: str) -> None:
@@ -366,27 +817,60 @@ def term_logfile(logger: logging.Logger, filename: str) -> None:
       - modulefilepathname (str) = module file path and name (e.g. __file__)
 
     OUTPUT:
-      - NONE (creates logging record message)
+      - NONE (creates logging record message, then writes queued and buffered log records and closes logfile; call last)
     '''
-    logger.info('\n'
-                '========== ENDING ==========\n'
-                'FILE: ' + filename
-                )
+    logger.info(_ENDING_BANNER + filename)
+
+    # Write queued and buffered log records (e.g. logfile batches) to their destinations, then close logfile.
+    reset()
 
 
 # Usage example
 if __name__ == '__main__':
+    # User help message for unexpected exceptions, shared by exception handlers below.
+    _SUPPORT_BLURB = (
+        'But, don\'t worry! Let\'s figure out what went wrong and'
+        ' get you back on track. First, please double-check the'
+        ' information you entered. Make sure everything is correct'
+        ' and matches what you intended. If there\'s anything that'
+        ' needs to be changed, go ahead and fix it.\n'
+        '\n'
+        'If you\'re still having trouble, we\'re here to help! You'
+        ' can reach out to our support team in a way that\'s most'
+        ' convenient for you.\n'
+        '\n'
+        'If you like chatting online, you can connect with a'
+        ' support team member on our website at'
+        ' support-chat.domain.tld. They\'re available all the time'
+        ' to assist you.\n'
+        '\n'
+        'If you prefer talking on the phone, you can call us at'
+        ' 800-555-1234 on weekdays between 9 AM and 5 PM Central'
+        ' Time.\n'
+        '\n'
+        'If you want to send us a message and get a response by'
+        ' email, you can use our online support request form at'
+        ' support-form.domain.tld. We\'ll make sure to get back'
+        ' to you within 1 to 2 business days.\n'
+        '\n'
+        'We\'re here to make sure everything runs smoothly for'
+        ' you, so don\'t hesitate to get in touch.\n'
+        '\n'
+        'Technical Error Details to Share with Our Help Desk Team:'
+    )
+
     # Configure command line interface arguments plus help and usage messages
     args = get_cli_help()
 
     try: # Code to execute, at least until an exception occurs
         # Configure logging per command line options
+        level = logging.DEBUG if args.debug else logging.INFO
         if args.logtype[0] == '1':
-            mylog = setup()
+            mylog = setup(level=level)
         elif args.logtype[0] == '2':
-            mylog = init_logfile(args.logpath, __file__)
+            mylog = init_logfile(args.logpath, __file__, level=level)
         else:
-            mylog = setup(args.logpathfilename)
+            mylog = setup(args.logpathfilename, level=level)
 
         # Process module's Python code.
         print('⬛ User Console Message: Trying actions.')
@@ -460,34 +944,7 @@ if __name__ == '__main__':
             ' make sure it doesn\'t give you any wrong or unreliable'
             ' information.\n'
             '\n'
-            'But, don\'t worry! Let\'s figure out what went wrong and'
-            ' get you back on track. First, please double-check the'
-            ' information you entered. Make sure everything is correct'
-            ' and matches what you intended. If there\'s anything that'
-            ' needs to be changed, go ahead and fix it.\n'
-            '\n'
-            'If you\'re still having trouble, we\'re here to help! You'
-            ' can reach out to our support team in a way that\'s most'
-            ' convenient for you.\n'
-            '\n'
-            'If you like chatting online, you can connect with a'
-            ' support team member on our website at'
-            ' support-chat.domain.tld. They\'re available all the time'
-            ' to assist you.\n'
-            '\n'
-            'If you prefer talking on the phone, you can call us at'
-            ' 800-555-1234 on weekdays between 9 AM and 5 PM Central'
-            ' Time.\n'
-            '\n'
-            'If you want to send us a message and get a response by'
-            ' email, you can use our online support request form at'
-            ' support-form.domain.tld. We\'ll make sure to get back'
-            ' to you within 1 to 2 business days.\n'
-            '\n'
-            'We\'re here to make sure everything runs smoothly for'
-            ' you, so don\'t hesitate to get in touch.\n'
-            '\n'
-            'Technical Error Details to Share with Our Help Desk Team:'
+            + _SUPPORT_BLURB
         )
     except Exception as e: # Code to handle unspecified exception
         mylog.exception(
@@ -495,34 +952,7 @@ if __name__ == '__main__':
             ' make sure it doesn\'t give you any wrong or unreliable'
             ' information.\n'
             '\n'
-            'But, don\'t worry! Let\'s figure out what went wrong and'
-            ' get you back on track. First, please double-check the'
-            ' information you entered. Make sure everything is correct'
-            ' and matches what you intended. If there\'s anything that'
-            ' needs to be changed, go ahead and fix it.\n'
-            '\n'
-            'If you\'re still having trouble, we\'re here to help! You'
-            ' can reach out to our support team in a way that\'s most'
-            ' convenient for you.\n'
-            '\n'
-            'If you like chatting online, you can connect with a'
-            ' support team member on our website at'
-            ' support-chat.domain.tld. They\'re available all the time'
-            ' to assist you.\n'
-            '\n'
-            'If you prefer talking on the phone, you can call us at'
-            ' 800-555-1234 on weekdays between 9 AM and 5 PM Central'
-            ' Time.\n'
-            '\n'
-            'If you want to send us a message and get a response by'
-            ' email, you can use our online support request form at'
-            ' support-form.domain.tld. We\'ll make sure to get back'
-            ' to you within 1 to 2 business days.\n'
-            '\n'
-            'We\'re here to make sure everything runs smoothly for'
-            ' you, so don\'t hesitate to get in touch.\n'
-            '\n'
-            'Technical Error Details to Share with Our Help Desk Team:'
+            + _SUPPORT_BLURB
         )
 
 